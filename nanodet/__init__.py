@@ -0,0 +1 @@
+"""NanoDet object detection with ONNX Runtime."""
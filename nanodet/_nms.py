@@ -0,0 +1,63 @@
+"""Greedy non-maximum suppression compiled with Numba.
+
+This module provides an NMS kernel working directly on (x1, y1, x2, y2)
+float32 arrays, so detections never have to be converted to Python lists.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def nms_xyxy(boxes, scores, class_ids, score_threshold, iou_threshold):
+    """Run greedy class-aware non-maximum suppression.
+
+    Boxes only suppress other boxes with the same class ID.
+
+    Args:
+        boxes (ndarray): Bounding boxes of shape (N, 4) in xyxy format
+        scores (ndarray): Confidence scores of shape (N,)
+        class_ids (ndarray): Class IDs of shape (N,)
+        score_threshold (float): Boxes scoring at or below this are dropped
+        iou_threshold (float): IoU above which lower-scoring boxes are suppressed
+
+    Returns:
+        ndarray: Indices of kept boxes, sorted by decreasing score
+    """
+    n = boxes.shape[0]
+    order = np.argsort(-scores)
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    suppressed = np.zeros(n, dtype=np.bool_)
+    keep = np.empty(n, dtype=np.int64)
+    num_keep = 0
+    for oi in range(n):
+        i = order[oi]
+        if scores[i] <= score_threshold:
+            break
+        if suppressed[i]:
+            continue
+        keep[num_keep] = i
+        num_keep += 1
+        for oj in range(oi + 1, n):
+            j = order[oj]
+            if suppressed[j] or class_ids[j] != class_ids[i]:
+                continue
+            w = min(boxes[i, 2], boxes[j, 2]) - max(boxes[i, 0], boxes[j, 0])
+            h = min(boxes[i, 3], boxes[j, 3]) - max(boxes[i, 1], boxes[j, 1])
+            if w <= 0 or h <= 0:
+                continue
+            inter = w * h
+            union = areas[i] + areas[j] - inter
+            if union > 0 and inter > iou_threshold * union:
+                suppressed[j] = True
+    return keep[:num_keep]
+
+
+# Compile (or load from cache) at import time instead of on the first frame
+nms_xyxy(
+    np.zeros((1, 4), dtype=np.float32),
+    np.zeros(1, dtype=np.float32),
+    np.zeros(1, dtype=np.int64),
+    0.0,
+    0.0,
+)
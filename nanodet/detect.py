@@ -9,6 +9,21 @@ import numpy as np
 import argparse
 import onnxruntime as ort
 import math
+import os
+import sys
+
+if __package__:
+    from ._decode import decode
+    from ._nms import nms_xyxy
+else:
+    # Running as a script (``python detect.py``). The helpers are still
+    # imported through the package, because Numba's on-disk cache records
+    # the module name and must match between both entry points.
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    from nanodet._decode import decode
+    from nanodet._nms import nms_xyxy
 
 
 class NanoDet:
@@ -18,7 +33,7 @@ class NanoDet:
     It handles model initialization, image preprocessing, inference and post-processing.
 
     Attributes:
-        classes (list): List of class names
+        classes (tuple): Class names
         num_classes (int): Number of object classes
         prob_threshold (float): Confidence threshold for detections
         iou_threshold (float): IoU threshold for NMS
@@ -31,10 +46,18 @@ class NanoDet:
         strides (tuple): Feature map strides
         mlvl_anchors (list): Multi-level anchor boxes
         keep_ratio (bool): Whether to keep aspect ratio in preprocessing
+        resize_interp (int): OpenCV interpolation flag used for resizing
+        verbose (bool): Whether to print detections to stdout
     """
 
     def __init__(
-        self, model_pb_path, label_path, prob_threshold=0.4, iou_threshold=0.3
+        self,
+        model_pb_path,
+        label_path,
+        prob_threshold=0.4,
+        iou_threshold=0.3,
+        verbose=False,
+        gpu_post_process=False,
     ):
         """Initialize NanoDet detector.
 
@@ -43,10 +66,14 @@ class NanoDet:
             label_path (str): Path to class labels file
             prob_threshold (float): Confidence threshold for filtering detections
             iou_threshold (float): IoU threshold for NMS
+            verbose (bool): Print each detection to stdout
+            gpu_post_process (bool): Decode boxes and run NMS on the GPU with
+                torch/torchvision when the session runs on the CUDA provider
         """
-        self.classes = list(
-            map(lambda x: x.strip(), open(label_path, "r").readlines())
-        )
+        with open(label_path, "r") as f:
+            self.classes = tuple(line.strip() for line in f)
+        self._class_prefix = [c + ": " for c in self.classes]
+        self.verbose = verbose
         self.num_classes = len(self.classes)
         self.prob_threshold = prob_threshold
         self.iou_threshold = iou_threshold
@@ -58,24 +85,59 @@ class NanoDet:
         self.std = np.array([57.375, 57.12, 58.395], dtype=np.float32).reshape(
             1, 1, 3
         )
+        self._mean3 = tuple(float(m) for m in self.mean.reshape(3))
+        self._scale = (1.0 / self.std).reshape(1, 3, 1, 1).astype(np.float32)
 
         # Initialize ONNX Runtime session
         so = ort.SessionOptions()
         so.log_severity_level = 3
-        self.net = ort.InferenceSession(model_pb_path, so)
+        so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        so.intra_op_num_threads = max(1, (os.cpu_count() or 1) // 2)
+        providers = [
+            p
+            for p in (
+                "CUDAExecutionProvider",
+                "CoreMLExecutionProvider",
+                "DmlExecutionProvider",
+                "CPUExecutionProvider",
+            )
+            if p in ort.get_available_providers()
+        ]
+        self.net = ort.InferenceSession(model_pb_path, so, providers=providers)
         self.input_shape = (
             self.net.get_inputs()[0].shape[2],
             self.net.get_inputs()[0].shape[3],
         )
 
+        # Bind persistent input/output buffers so inference reuses them
+        self._blob = np.empty(
+            (1, 3, self.input_shape[0], self.input_shape[1]), dtype=np.float32
+        )
+        self._out = np.empty(
+            (1,) + tuple(self.net.get_outputs()[0].shape[1:]), dtype=np.float32
+        )
+        self._io = self.net.io_binding()
+        self._io.bind_ortvalue_input(
+            self.net.get_inputs()[0].name,
+            ort.OrtValue.ortvalue_from_numpy(self._blob),
+        )
+        self._io.bind_ortvalue_output(
+            self.net.get_outputs()[0].name,
+            ort.OrtValue.ortvalue_from_numpy(self._out),
+        )
+
         # Model parameters
         self.reg_max = (
             int((self.net.get_outputs()[0].shape[-1] - self.num_classes) / 4)
             - 1
         )
-        self.project = np.arange(self.reg_max + 1)
+        self.project = np.arange(self.reg_max + 1, dtype=np.float32)
         self.strides = (8, 16, 32, 64)
         self.mlvl_anchors = []
+        self._canvas = np.zeros(
+            (self.input_shape[0], self.input_shape[1], 3), dtype=np.uint8
+        )
+        self._canvas_roi = None
 
         # Generate anchors
         for i in range(len(self.strides)):
@@ -87,7 +149,79 @@ class NanoDet:
                 self.strides[i],
             )
             self.mlvl_anchors.append(anchors)
+
+        # Flatten anchors across levels so post-processing runs in one pass
+        self._anchors_all = np.concatenate(self.mlvl_anchors, axis=0)
+        self._stride_vec = np.concatenate(
+            [
+                np.full(anchors.shape[0], stride, dtype=np.float32)
+                for stride, anchors in zip(self.strides, self.mlvl_anchors)
+            ]
+        )
+
+        # Scratch buffers reused by post_process across frames
+        num_anchors = self._anchors_all.shape[0]
+        self._class_ids_all = np.empty(num_anchors, dtype=np.int64)
+        self._conf_all = np.empty(num_anchors, dtype=np.float32)
+        self._bboxes_all = np.empty((num_anchors, 4), dtype=np.float32)
+        self._dynamic_batch = not isinstance(
+            self.net.get_inputs()[0].shape[0], int
+        )
+        self._blob_b = None
+        self._use_cuda_post = False
+        if (
+            gpu_post_process
+            and "CUDAExecutionProvider" in self.net.get_providers()
+        ):
+            self._use_cuda_post = self._init_cuda_post_process()
         self.keep_ratio = False
+        self.resize_interp = cv2.INTER_LINEAR
+
+    def _init_cuda_post_process(self):
+        """Keep the model output on the GPU for post-processing with torch.
+
+        Rebinds the inference output to a preallocated CUDA tensor and
+        uploads the anchors, strides and project array next to it. torch and
+        torchvision are imported here so CPU-only sessions never load them.
+
+        Returns:
+            bool: True if GPU post-processing is set up, False if torch,
+                torchvision or a CUDA device is unavailable
+        """
+        try:
+            import torch
+            import torchvision
+        except ImportError:
+            return False
+        if not torch.cuda.is_available():
+            return False
+
+        device = torch.device("cuda", 0)
+        self._out_cuda = torch.empty(
+            self._out.shape, dtype=torch.float32, device=device
+        )
+        self._io.bind_output(
+            name=self.net.get_outputs()[0].name,
+            device_type="cuda",
+            device_id=0,
+            element_type=np.float32,
+            shape=tuple(self._out_cuda.shape),
+            buffer_ptr=self._out_cuda.data_ptr(),
+        )
+        self._anchors_cuda = torch.from_numpy(self._anchors_all).to(device)
+        self._stride_cuda = torch.from_numpy(self._stride_vec).to(device)
+        self._project_cuda = torch.from_numpy(self.project).to(device)
+        self._max_shape_cuda = torch.tensor(
+            [
+                self.input_shape[1],
+                self.input_shape[0],
+                self.input_shape[1],
+                self.input_shape[0],
+            ],
+            dtype=torch.float32,
+            device=device,
+        )
+        return True
 
     def _make_grid(self, featmap_size, stride):
         """Generate grid of anchor points.
@@ -97,47 +231,60 @@ class NanoDet:
             stride (int): Stride of feature map
 
         Returns:
-            ndarray: Grid of anchor points
+            ndarray: Grid of anchor points (float32)
         """
         feat_h, feat_w = featmap_size
-        shift_x = np.arange(0, feat_w) * stride
-        shift_y = np.arange(0, feat_h) * stride
-        xv, yv = np.meshgrid(shift_x, shift_y)
-        xv = xv.flatten()
-        yv = yv.flatten()
-        return np.stack((xv, yv), axis=-1)
+        yv, xv = np.mgrid[0:feat_h, 0:feat_w].astype(np.float32)
+        xv *= stride
+        yv *= stride
+        return np.stack((xv.ravel(), yv.ravel()), axis=-1)
 
     def softmax(self, x, axis=1):
-        """Apply softmax function.
+        """Apply numerically stable softmax function in place.
+
+        :meth:`post_process` runs the same math fused into the Numba decode
+        kernel; this NumPy version is kept for callers of the public API.
 
         Args:
-            x (ndarray): Input array
+            x (ndarray): Input array, overwritten with the result
             axis (int): Axis to apply softmax
 
         Returns:
-            ndarray: Softmax output
+            ndarray: Softmax output (the same array as ``x``)
         """
-        x_exp = np.exp(x)
-        x_sum = np.sum(x_exp, axis=axis, keepdims=True)
-        s = x_exp / x_sum
-        return s
+        np.subtract(x, x.max(axis=axis, keepdims=True), out=x)
+        np.exp(x, out=x)
+        np.multiply(x, 1.0 / x.sum(axis=axis, keepdims=True), out=x)
+        return x
 
-    def _normalize(self, img):
-        """Normalize image.
+    def _normalize(self, img, out=None):
+        """Normalize image into the reusable NCHW input blob.
 
         Args:
-            img (ndarray): Input image
+            img (ndarray): Input image already resized to the model input size
+            out (ndarray): Optional (1, 3, H, W) array to write the blob into
 
         Returns:
-            ndarray: Normalized image
+            ndarray: Normalized blob of shape (1, 3, H, W)
         """
-        img = img.astype(np.float32)
-        img = (img - self.mean) / self.std
-        return img
+        if out is None:
+            out = self._blob
+        blob = cv2.dnn.blobFromImage(
+            img,
+            scalefactor=1.0,
+            size=(self.input_shape[1], self.input_shape[0]),
+            mean=self._mean3,
+            swapRB=False,
+        )
+        np.multiply(blob, self._scale, out=out)
+        return out
 
     def resize_image(self, srcimg, keep_ratio=True):
         """Resize image to model input size.
 
+        The result is written into a canvas shared across calls, so it is
+        only valid until the next call.
+
         Args:
             srcimg (ndarray): Source image
             keep_ratio (bool): Whether to keep aspect ratio
@@ -149,45 +296,24 @@ class NanoDet:
         if keep_ratio and srcimg.shape[0] != srcimg.shape[1]:
             hw_scale = srcimg.shape[0] / srcimg.shape[1]
             if hw_scale > 1:
-                newh, neww = self.input_shape[0], int(
-                    self.input_shape[1] / hw_scale
-                )
-                img = cv2.resize(
-                    srcimg, (neww, newh), interpolation=cv2.INTER_AREA
-                )
+                neww = int(self.input_shape[1] / hw_scale)
                 left = int((self.input_shape[1] - neww) * 0.5)
-                img = cv2.copyMakeBorder(
-                    img,
-                    0,
-                    0,
-                    left,
-                    self.input_shape[1] - neww - left,
-                    cv2.BORDER_CONSTANT,
-                    value=0,
-                )
             else:
-                newh, neww = (
-                    int(self.input_shape[0] * hw_scale),
-                    self.input_shape[1],
-                )
-                img = cv2.resize(
-                    srcimg, (neww, newh), interpolation=cv2.INTER_AREA
-                )
+                newh = int(self.input_shape[0] * hw_scale)
                 top = int((self.input_shape[0] - newh) * 0.5)
-                img = cv2.copyMakeBorder(
-                    img,
-                    top,
-                    self.input_shape[0] - newh - top,
-                    0,
-                    0,
-                    cv2.BORDER_CONSTANT,
-                    value=0,
-                )
-        else:
-            img = cv2.resize(
-                srcimg, self.input_shape, interpolation=cv2.INTER_AREA
-            )
-        return img, newh, neww, top, left
+
+        # Clear the padding left over from a frame with a different layout
+        roi = (top, left, newh, neww)
+        if roi != self._canvas_roi:
+            self._canvas.fill(0)
+            self._canvas_roi = roi
+        cv2.resize(
+            srcimg,
+            (neww, newh),
+            dst=self._canvas[top : top + newh, left : left + neww],
+            interpolation=self.resize_interp,
+        )
+        return self._canvas, newh, neww, top, left
 
     def post_process(self, preds, scale_factor=1, rescale=False):
         """Post-process model predictions.
@@ -200,84 +326,131 @@ class NanoDet:
         Returns:
             tuple: (bboxes, confidence scores, class IDs)
         """
-        mlvl_bboxes = []
-        mlvl_scores = []
-        ind = 0
-        for stride, anchors in zip(self.strides, self.mlvl_anchors):
-            cls_score, bbox_pred = (
-                preds[ind : (ind + anchors.shape[0]), : self.num_classes],
-                preds[ind : (ind + anchors.shape[0]), self.num_classes :],
-            )
-            ind += anchors.shape[0]
-            bbox_pred = self.softmax(
-                bbox_pred.reshape(-1, self.reg_max + 1), axis=1
-            )
-            bbox_pred = np.dot(bbox_pred, self.project).reshape(-1, 4)
-            bbox_pred *= stride
-
-            nms_pre = 1000
-            if nms_pre > 0 and cls_score.shape[0] > nms_pre:
-                max_scores = cls_score.max(axis=1)
-                topk_inds = max_scores.argsort()[::-1][0:nms_pre]
-                anchors = anchors[topk_inds, :]
-                bbox_pred = bbox_pred[topk_inds, :]
-                cls_score = cls_score[topk_inds, :]
-
-            bboxes = self.distance2bbox(
-                anchors, bbox_pred, max_shape=self.input_shape
-            )
-            mlvl_bboxes.append(bboxes)
-            mlvl_scores.append(cls_score)
-
-        mlvl_bboxes = np.concatenate(mlvl_bboxes, axis=0)
+        # Class scores are already sigmoid-activated inside the exported
+        # graph, so they are thresholded directly. Drop low-confidence
+        # anchors before decoding their boxes
+        max_scores = preds[:, : self.num_classes].max(axis=1)
+        keep = np.where(max_scores > self.prob_threshold)[0]
+
+        nms_pre = 1000
+        if nms_pre > 0 and keep.shape[0] > nms_pre:
+            keep = keep[max_scores[keep].argsort()[::-1][0:nms_pre]]
+
+        num_keep = keep.shape[0]
+        mlvl_bboxes = self._bboxes_all[:num_keep]
+        classIds = self._class_ids_all[:num_keep]
+        confidences = self._conf_all[:num_keep]  # max_class_confidence
+        decode(
+            preds,
+            keep,
+            self._anchors_all,
+            self._stride_vec,
+            self.project,
+            self.num_classes,
+            self.input_shape[0],
+            self.input_shape[1],
+            mlvl_bboxes,
+            classIds,
+            confidences,
+        )
         if rescale:
             mlvl_bboxes /= scale_factor
-        mlvl_scores = np.concatenate(mlvl_scores, axis=0)
 
-        bboxes_wh = mlvl_bboxes.copy()
-        bboxes_wh[:, 2:4] = bboxes_wh[:, 2:4] - bboxes_wh[:, 0:2]  # xywh
-        classIds = np.argmax(mlvl_scores, axis=1)
-        confidences = np.max(mlvl_scores, axis=1)  # max_class_confidence
-
-        indices = cv2.dnn.NMSBoxes(
-            bboxes_wh.tolist(),
-            confidences.tolist(),
+        indices = nms_xyxy(
+            mlvl_bboxes,
+            confidences,
+            classIds,
             self.prob_threshold,
             self.iou_threshold,
-        ).flatten()
+        )
         if len(indices) > 0:
             mlvl_bboxes = mlvl_bboxes[indices]
             confidences = confidences[indices]
             classIds = classIds[indices]
             return mlvl_bboxes, confidences, classIds
         else:
-            print("Nothing detected")
+            if self.verbose:
+                print("Nothing detected")
+            return np.array([]), np.array([]), np.array([])
+
+    def _post_process_cuda(self, preds):
+        """Post-process the GPU-resident model output with torch.
+
+        Mirrors :meth:`post_process` but decodes boxes and runs class-aware
+        NMS on the GPU, so only the kept detections are copied to the host.
+
+        Args:
+            preds (torch.Tensor): Raw model predictions for one image
+
+        Returns:
+            tuple: (bboxes, confidence scores, class IDs)
+        """
+        import torch
+        import torchvision
+
+        confidences, classIds = preds[:, : self.num_classes].max(dim=1)
+        keep = torch.nonzero(confidences > self.prob_threshold).squeeze(1)
+
+        nms_pre = 1000
+        if nms_pre > 0 and keep.numel() > nms_pre:
+            keep = keep[confidences[keep].topk(nms_pre).indices]
+
+        bbox_pred = preds[keep, self.num_classes :].reshape(
+            -1, 4, self.reg_max + 1
+        )
+        distance = bbox_pred.softmax(dim=2) @ self._project_cuda
+        distance *= self._stride_cuda[keep, None]
+        anchors = self._anchors_cuda[keep]
+        bboxes = torch.cat(
+            (anchors - distance[:, 0:2], anchors + distance[:, 2:4]), dim=1
+        )
+        bboxes = torch.minimum(bboxes.clamp_(min=0), self._max_shape_cuda)
+        confidences = confidences[keep]
+        classIds = classIds[keep]
+
+        indices = torchvision.ops.batched_nms(
+            bboxes, confidences, classIds, self.iou_threshold
+        )
+        if indices.numel() > 0:
+            return (
+                bboxes[indices].cpu().numpy(),
+                confidences[indices].cpu().numpy(),
+                classIds[indices].cpu().numpy(),
+            )
+        else:
+            if self.verbose:
+                print("Nothing detected")
             return np.array([]), np.array([]), np.array([])
 
-    def distance2bbox(self, points, distance, max_shape=None):
+    def distance2bbox(self, points, distance, max_shape=None, out=None):
         """Convert distance predictions to bounding boxes.
 
+        :meth:`post_process` runs the same math fused into the Numba decode
+        kernel; this NumPy version is kept for callers of the public API.
+
         Args:
             points (ndarray): Anchor points
             distance (ndarray): Distance predictions
             max_shape (tuple): Maximum shape for clipping
+            out (ndarray): Optional (N, 4) array to write the boxes into
 
         Returns:
             ndarray: Predicted bounding boxes
         """
         # Handle empty arrays
         if points.size == 0 or distance.size == 0:
-            return np.zeros((0, 4))
-        x1 = points[:, 0] - distance[:, 0]
-        y1 = points[:, 1] - distance[:, 1]
-        x2 = points[:, 0] + distance[:, 2]
-        y2 = points[:, 1] + distance[:, 3]
+            return np.zeros((0, 4), dtype=np.float32)
+        if out is None:
+            out = np.empty((points.shape[0], 4), dtype=np.float32)
+        np.subtract(points, distance[:, 0:2], out=out[:, 0:2])
+        np.add(points, distance[:, 2:4], out=out[:, 2:4])
         if max_shape is not None:
-            x1 = np.clip(x1, 0, max_shape[1])
-            y1 = np.clip(y1, 0, max_shape[0])
-            x2 = np.clip(x2, 0, max_shape[1])
-            y2 = np.clip(y2, 0, max_shape[0])
-        return np.stack([x1, y1, x2, y2], axis=-1)
+            hi = np.array(
+                [max_shape[1], max_shape[0], max_shape[1], max_shape[0]],
+                dtype=np.float32,
+            )
+            np.clip(out, 0, hi, out=out)
+        return out
 
     def detect(self, srcimg):
         """Run detection on an image.
@@ -291,35 +464,95 @@ class NanoDet:
         img, newh, neww, top, left = self.resize_image(
             srcimg, keep_ratio=self.keep_ratio
         )
-        img = self._normalize(img)
-        blob = np.expand_dims(np.transpose(img, (2, 0, 1)), axis=0)
+        self._normalize(img)
 
-        outs = self.net.run(None, {self.net.get_inputs()[0].name: blob})[
-            0
-        ].squeeze(axis=0)
-        det_bboxes, det_conf, det_classid = self.post_process(outs)
+        self.net.run_with_iobinding(self._io)
+        if self._use_cuda_post:
+            dets = self._post_process_cuda(self._out_cuda[0])
+        else:
+            dets = self.post_process(self._out.squeeze(axis=0))
+        return self._draw_detections(srcimg, dets, newh, neww, top, left)
 
-        ratioh, ratiow = srcimg.shape[0] / newh, srcimg.shape[1] / neww
-        for i in range(det_bboxes.shape[0]):
-            xmin, ymin, xmax, ymax = (
-                max(int((det_bboxes[i, 0] - left) * ratiow), 0),
-                max(int((det_bboxes[i, 1] - top) * ratioh), 0),
-                min(int((det_bboxes[i, 2] - left) * ratiow), srcimg.shape[1]),
-                min(int((det_bboxes[i, 3] - top) * ratioh), srcimg.shape[0]),
+    def detect_batch(self, srcimgs):
+        """Run detection on a list of images with a single inference call.
+
+        Models exported with a fixed batch size, such as the bundled model,
+        fall back to one :meth:`detect` call per image.
+
+        Only inference is batched. Each sample is still decoded and run
+        through NMS on its own with :meth:`post_process`, rather than
+        decoding the whole (B, N, ...) output at once: after the confidence
+        prefilter few rows remain per image, and NMS is per sample anyway.
+
+        Args:
+            srcimgs (list): Source images
+
+        Returns:
+            list: Images with detection visualizations
+        """
+        if not self._dynamic_batch:
+            return [self.detect(srcimg) for srcimg in srcimgs]
+
+        batch_size = len(srcimgs)
+        if batch_size == 0:
+            return []
+        if self._blob_b is None or self._blob_b.shape[0] != batch_size:
+            self._blob_b = np.empty(
+                (batch_size,) + self._blob.shape[1:], dtype=np.float32
             )
+        letterboxes = []
+        for i, srcimg in enumerate(srcimgs):
+            img, newh, neww, top, left = self.resize_image(
+                srcimg, keep_ratio=self.keep_ratio
+            )
+            self._normalize(img, out=self._blob_b[i : i + 1])
+            letterboxes.append((newh, neww, top, left))
+
+        outs = self.net.run(
+            None, {self.net.get_inputs()[0].name: self._blob_b}
+        )[0]
+        return [
+            self._draw_detections(
+                srcimg, self.post_process(out), *letterbox
+            )
+            for srcimg, out, letterbox in zip(srcimgs, outs, letterboxes)
+        ]
+
+    def _draw_detections(self, srcimg, dets, newh, neww, top, left):
+        """Draw post-processed detections on the source image.
+
+        Args:
+            srcimg (ndarray): Source image
+            dets (tuple): (bboxes, confidence scores, class IDs) in model
+                input coordinates
+            newh (int): Height of the resized image inside the input
+            neww (int): Width of the resized image inside the input
+            top (int): Top padding of the resized image
+            left (int): Left padding of the resized image
+
+        Returns:
+            ndarray: Image with detection visualizations
+        """
+        det_bboxes, det_conf, det_classid = dets
+
+        ratioh, ratiow = srcimg.shape[0] / newh, srcimg.shape[1] / neww
+        offs = np.array([left, top, left, top], dtype=np.float32)
+        ratios = np.array([ratiow, ratioh, ratiow, ratioh], dtype=np.float32)
+        xy = ((det_bboxes.reshape(-1, 4) - offs) * ratios).astype(np.int32)
+        np.clip(xy[:, 0::2], 0, srcimg.shape[1], out=xy[:, 0::2])
+        np.clip(xy[:, 1::2], 0, srcimg.shape[0], out=xy[:, 1::2])
+        for (xmin, ymin, xmax, ymax), classid, conf in zip(
+            xy.tolist(), det_classid.tolist(), det_conf.tolist()
+        ):
+            label = f"{self._class_prefix[classid]}{conf:.3f}"
             cv2.rectangle(
                 srcimg, (xmin, ymin), (xmax, ymax), (0, 0, 255), thickness=1
             )
-            print(
-                self.classes[det_classid[i]]
-                + ": "
-                + str(round(det_conf[i], 3))
-            )
+            if self.verbose:
+                print(label)
             cv2.putText(
                 srcimg,
-                self.classes[det_classid[i]]
-                + ": "
-                + str(round(det_conf[i], 3)),
+                label,
                 (xmin, ymin - 10),
                 cv2.FONT_HERSHEY_SIMPLEX,
                 0.5,
@@ -328,6 +561,7 @@ class NanoDet:
             )
         return srcimg
 
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -368,6 +602,7 @@ if __name__ == "__main__":
         args.classfile,
         prob_threshold=args.conf_threshold,
         iou_threshold=args.nms_threshold,
+        verbose=True,
     )
     output_image = detector.detect(source_image)
 